@@ -38,13 +38,15 @@ def read_dockerfile(file_path: Path) -> str:
         console.print(f"[red]Error reading Dockerfile: {str(e)}[/red]")
         raise typer.Exit(1)
 
+# Triple-quoted Dockerfile code block in the analysis text
+_DOCKERFILE_BLOCK_RE = re.compile(r'```(?:dockerfile|Dockerfile)?\n(.*?)```', re.DOTALL)
+
 def extract_dockerfile_content(text: str) -> str:
     """Extract the Dockerfile content from the analysis text.
     Expects the Dockerfile to be in a triple-quoted code block.
     """
     # Look for triple-quoted Dockerfile code block
-    pattern = r'```(?:dockerfile|Dockerfile)?\n(.*?)```'
-    match = re.search(pattern, text, re.DOTALL)
+    match = _DOCKERFILE_BLOCK_RE.search(text)
     
     if match:
         content = match.group(1).strip()
@@ -60,7 +62,11 @@ async def query_ollama(dockerfile_content: str, model: str) -> str:
 
     async with httpx.AsyncClient() as client:
         try:
-            response = await client.post(
+            # Handle streaming response; lines are parsed as they arrive and
+            # reading stops at the "done" chunk
+            chunks = []
+            async with client.stream(
+                "POST",
                 "http://localhost:11434/api/generate",
                 json={
                     "model": model,
@@ -70,22 +76,21 @@ async def query_ollama(dockerfile_content: str, model: str) -> str:
                     "max_tokens": 4000
                 },
                 timeout=120.0
-            )
-            response.raise_for_status()
-            
-            # Handle streaming response
-            full_response = ""
-            for line in response.text.strip().split('\n'):
-                if line.strip():
-                    try:
-                        data = json.loads(line)
-                        if 'response' in data:
-                            full_response += data['response']
-                        if data.get('done', False):
-                            break
-                    except json.JSONDecodeError:
-                        continue
-            
+            ) as response:
+                response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    if line.strip():
+                        try:
+                            data = json.loads(line)
+                            if 'response' in data:
+                                chunks.append(data['response'])
+                            if data.get('done', False):
+                                break
+                        except json.JSONDecodeError:
+                            continue
+            full_response = "".join(chunks)
+
             if not full_response.strip():
                 raise ValueError("Empty response from Ollama")
             
@@ -135,19 +140,18 @@ def display_typewriter(text: str, speed: float = 0.001, copyable: bool = False):
             return
 
         # Apply typewriter effect to the raw text
-        current_text = ""
-        buffer = ""
-        last_update = time.time()
+        shown = 0
+        last_update = time.monotonic()
         update_interval = 0.05  # Update every 50ms
-        
-        for char in text:
-            current_text += char
-            buffer += char
+
+        for index in range(1, len(text) + 1):
             time.sleep(speed)
-            
-            # Only update the display periodically to prevent lag
-            current_time = time.time()
+
+            # Only update the display periodically to prevent lag; the
+            # visible text is sliced out only when an update is due
+            current_time = time.monotonic()
             if current_time - last_update >= update_interval:
+                current_text = text[:index]
                 try:
                     # Create a new markdown and panel for the current text
                     current_markdown = Markdown(current_text)
@@ -163,12 +167,13 @@ def display_typewriter(text: str, speed: float = 0.001, copyable: bool = False):
                 except Exception:
                     # If markdown parsing fails, just show the raw text
                     live.update(current_text)
-                
-                buffer = ""
+
+                shown = index
                 last_update = current_time
-        
+
         # Final update to ensure all content is displayed
-        if buffer:
+        if shown < len(text):
+            current_text = text
             try:
                 current_markdown = Markdown(current_text)
                 current_panel = Panel(
@@ -183,11 +188,12 @@ def display_typewriter(text: str, speed: float = 0.001, copyable: bool = False):
             except Exception:
                 live.update(current_text)
 
+# Repository-root output directory, computed once
+_OUTPUT_DIR = Path(__file__).parent.parent.parent / "output"
+
 def get_output_dir() -> Path:
     """Get the path to the output directory."""
-    # Get the package root directory
-    package_root = Path(__file__).parent.parent.parent
-    return package_root / "output"
+    return _OUTPUT_DIR
 
 def ensure_output_dirs() -> tuple[Path, Path]:
     """Ensure output directories exist and return their paths.
@@ -1,16 +1,21 @@
 """Module for managing Dockerfile analysis prompts."""
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# Prompt templates directory at the repository root
+_PROMPT_DIR = Path(__file__).parent.parent.parent / "ai" / "prompts"
+
 def get_prompt_path() -> Path:
     """Get the path to the prompts directory."""
-    # Get the package root directory
-    package_root = Path(__file__).parent.parent.parent
-    return package_root / "ai" / "prompts"
+    return _PROMPT_DIR
 
+@lru_cache(maxsize=16)
 def read_prompt(prompt_name: str = "v2") -> str:
     """Read a prompt from the prompts directory.
     
+    Prompt templates are static, so the contents are cached per prompt name.
+    
     Args:
         prompt_name: Name of the prompt file to read (default: v2)
         